@@ -0,0 +1,144 @@
+# vim: set fileencoding=utf-8
+"""
+benchmarks/layered_layout.py
+
+This file benchmarks the built-in layered layout against Graphviz's dot layout.
+
+Copyright (C) 2023-today rydnr's nix-flake-to-graphviz
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from argparse import ArgumentParser
+import random
+from rydnr.nix.flake.graphviz import LayeredLayout
+import shutil
+import subprocess
+import time
+from typing import Dict, List, Tuple
+
+
+def synthetic_flake_graph(size: int, seed: int) -> List[Tuple[str, str]]:
+    """
+    Builds a synthetic DAG shaped like an aggregated flake graph: a root with a
+    handful of direct inputs, and nodes that mostly depend on recent, shared inputs.
+    :param size: The number of nodes, besides the root.
+    :type size: int
+    :param seed: The random seed.
+    :type seed: int
+    :return: The (source, destination) edges.
+    :rtype: List[Tuple[str, str]]
+    """
+    rng = random.Random(seed)
+    direct = max(1, min(20, size // 10))
+    result = [("root", f"n{i}") for i in range(direct)]
+    for i in range(direct, size):
+        window = max(0, i - 100)
+        for _ in range(rng.randint(1, 3)):
+            result.append((f"n{rng.randrange(window, i)}", f"n{i}"))
+    return result
+
+
+def to_dot(
+    edges: List[Tuple[str, str]], positions: Dict[str, Tuple[float, float]] = None
+) -> str:
+    """
+    Renders given edges as a dot graph, with node positions if provided.
+    :param edges: The edges.
+    :type edges: List[Tuple[str, str]]
+    :param positions: The node positions.
+    :type positions: Dict[str, Tuple[float, float]]
+    :return: The dot content.
+    :rtype: str
+    """
+    lines = ["digraph G {", "  rankdir=LR;"]
+    if positions is not None:
+        lines.extend(
+            f'  {node} [pos="{x:g},{y:g}"];' for node, (x, y) in positions.items()
+        )
+    lines.extend(f"  {source} -> {destination};" for source, destination in edges)
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def render(command: List[str], content: str) -> float:
+    """
+    Renders given dot content to SVG.
+    :param command: The Graphviz command.
+    :type command: List[str]
+    :param content: The dot content.
+    :type content: str
+    :return: The elapsed time, in seconds.
+    :rtype: float
+    """
+    start = time.perf_counter()
+    subprocess.run(
+        command + ["-Tsvg"],
+        input=content.encode("utf-8"),
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    """
+    Runs the benchmark.
+    """
+    parser = ArgumentParser(description="Layered layout vs dot benchmark")
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 500, 1000, 2000, 5000],
+        help="The graph sizes (number of nodes)",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="The random seed")
+    parser.add_argument(
+        "--dot-limit",
+        type=int,
+        default=5000,
+        help="Skip plain dot for graphs bigger than this",
+    )
+    args = parser.parse_args()
+
+    graphviz = shutil.which("dot") is not None and shutil.which("neato") is not None
+    if not graphviz:
+        print("Graphviz not found; only the layered layout will be timed")
+
+    print(
+        f"{'nodes':>8} {'edges':>8} {'layered':>10} {'neato -n':>10} {'total':>10} {'dot':>10}"
+    )
+    for size in args.sizes:
+        edges = synthetic_flake_graph(size, args.seed)
+        start = time.perf_counter()
+        positions = LayeredLayout("root", edges).positions()
+        layered = time.perf_counter() - start
+        neato = dot = None
+        if graphviz:
+            neato = render(["neato", "-n"], to_dot(edges, positions))
+            if size <= args.dot_limit:
+                dot = render(["dot"], to_dot(edges))
+
+        def fmt(value):
+            return "-" if value is None else f"{value:.3f}s"
+
+        total = layered + neato if neato is not None else None
+        print(
+            f"{size:>8} {len(edges):>8} {fmt(layered):>10} {fmt(neato):>10} {fmt(total):>10} {fmt(dot):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
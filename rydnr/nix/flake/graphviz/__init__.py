@@ -21,5 +21,12 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 __path__ = __import__("pkgutil").extend_path(__path__, __name__)
 
+from .layered_layout import LayeredLayout
+from .node_position import NodePosition
 from .nix_flake_metadata_decorator import NixFlakeMetadataDecorator
+from .html_viewer import HtmlViewer
 from .dot import Dot
+from .diff_node import DiffNode
+from .flake_lock import FlakeLock
+from .flake_lock_diff import FlakeLockDiff
+from .flake_diff import FlakeDiff
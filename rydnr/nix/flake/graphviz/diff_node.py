@@ -0,0 +1,67 @@
+# vim: set fileencoding=utf-8
+"""
+rydnr/nix/flake/graphviz/diff_node.py
+
+This file defines the DiffNode class.
+
+Copyright (C) 2023-today rydnr's nix-flake-to-graphviz
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.shared import primary_key_attribute, ValueObject
+
+
+class DiffNode(ValueObject):
+    """
+    A node of the graph representing the differences between two flake locks.
+
+    Class name: DiffNode
+
+    Responsibilities:
+        - Provide the identifier and label of a node to templates.
+
+    Collaborators:
+        - rydnr.nix.flake.graphviz.FlakeLockDiff
+    """
+
+    def __init__(self, id: str, label: str):
+        """
+        Creates a new DiffNode instance.
+        :param id: The node identifier.
+        :type id: str
+        :param label: The node label.
+        :type label: str
+        """
+        super().__init__()
+        self._id = id
+        self._label = label
+
+    @property
+    @primary_key_attribute
+    def id(self) -> str:
+        """
+        Retrieves the node identifier.
+        :return: Such identifier.
+        :rtype: str
+        """
+        return self._id
+
+    @property
+    def label(self) -> str:
+        """
+        Retrieves the node label.
+        :return: Such label.
+        :rtype: str
+        """
+        return self._label
@@ -19,13 +19,15 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+from .html_viewer import HtmlViewer
+from .layered_layout import LayeredLayout
 from .nix_flake_metadata_decorator import NixFlakeMetadataDecorator
-import os
+from .template_path import template_path
 from pythoneda.shared import EventListener, listen, primary_key_attribute
 from pythoneda.shared.nix.flake import NixFlakeMetadata
 from rydnr.nix.flake.graphviz.events import DotRequested
 from stringtemplate3 import StringTemplateGroup
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 
 class Dot(EventListener):
@@ -36,9 +38,11 @@ class Dot(EventListener):
 
     Responsibilities:
         - Generate valid dot files from Nix flake's inputs.
+        - Optionally, pre-position the nodes so the output can be rendered without Graphviz's layout.
 
     Collaborators:
-        - None
+        - rydnr.nix.flake.graphviz.LayeredLayout
+        - rydnr.nix.flake.graphviz.HtmlViewer: For HTML output.
     """
 
     def __init__(self):
@@ -47,16 +51,18 @@ class Dot(EventListener):
         """
         super().__init__()
 
-    def dot(self, flakeRef: str) -> str:
+    def dot(self, flakeRef: str, layout: str = "dot") -> str:
         """
         Retrieves a dot representation of the flake metadata.
         :param flakeRef: The flake reference (either a folder or an url).
         :type flakeRef: str
+        :param layout: The layout: "dot" leaves it to Graphviz, "layered" pre-positions the nodes.
+        :type layout: str
         :return: Such content.
         :rtype: str
         """
         nix_flake_metadata = NixFlakeMetadata.from_ref(flakeRef)
-        return self._convert_to_dot_format(nix_flake_metadata)
+        return self._convert_to_dot_format(nix_flake_metadata, layout)
 
     def _build_label(self, node: str, version: str = None) -> str:
         """
@@ -86,52 +92,73 @@ class Dot(EventListener):
         """
         return None
 
-    def _get_template_path(self, fileName: str) -> str:
+    def _graph_edges(self, metadata: NixFlakeMetadata) -> List[Tuple[str, str]]:
         """
-        Retrieves the path of the template matching given name.
-        :param fileName: The name of the file of the template.
-        :type fileName: str
-        :return: The path of the template.
-        :rtype: str
+        Retrieves the edges of the graph, as rendered by the dot template.
+        :param metadata: The Nix flake metadata.
+        :type metadata: pythoneda.shared.nix.flake.NixFlakeMetadata
+        :return: The (source, destination) node names.
+        :rtype: List[Tuple[str, str]]
         """
-        return os.path.join(
-            os.path.dirname(
-                os.path.dirname(
-                    os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-                )
-            ),
-            "templates",
-            fileName,
+        result = [("root", dep.name_in_camelcase) for dep in metadata.inputs()]
+        result.extend(
+            (edge.source.name_in_camelcase, edge.destination.name_in_camelcase)
+            for edge in metadata.all_relationships()
         )
+        return result
+
+    def _compute_positions(
+        self, metadata: NixFlakeMetadata, layout: str
+    ) -> Optional[Dict[str, Tuple[float, float]]]:
+        """
+        Computes the node positions for given layout.
+        :param metadata: The Nix flake metadata.
+        :type metadata: pythoneda.shared.nix.flake.NixFlakeMetadata
+        :param layout: The layout.
+        :type layout: str
+        :return: The position of each node, or None if Graphviz should lay the graph out.
+        :rtype: Optional[Dict[str, Tuple[float, float]]]
+        """
+        if layout == "layered":
+            return LayeredLayout("root", self._graph_edges(metadata)).positions()
+        return None
 
-    def _convert_to_dot_format(self, metadata: NixFlakeMetadata) -> str:
+    def _convert_to_dot_format(
+        self, metadata: NixFlakeMetadata, layout: str = "dot"
+    ) -> str:
         """
         Converts given flake metadata to dot format.
         :param metadata: The Nix flake metadata.
         :type metadata: pythoneda.shared.nix.flake.NixFlakeMetadata
+        :param layout: The layout.
+        :type layout: str
         :return: A dot-formatted representation of the Nix flake dependiencies.
         :rtype: str
         """
-        with open(self._get_template_path("dot.stg"), "r", encoding="utf-8") as f:
+        with open(template_path("dot.stg"), "r", encoding="utf-8") as f:
             # Create a group from the string content
             group = StringTemplateGroup(name="graph", file=f, rootDir="templates")
 
             root_template = group.getInstanceOf("graph")
 
         if root_template is not None:
-            root_template["flake"] = NixFlakeMetadataDecorator(metadata)
+            root_template["flake"] = NixFlakeMetadataDecorator(
+                metadata, self._compute_positions(metadata, layout)
+            )
 
         return str(root_template)
 
-    def generate_output(self, flakeRef: str, outputFile: str):
+    def generate_output(self, flakeRef: str, outputFile: str, layout: str = "dot"):
         """
         Generates the output file.
         :param flakeRef: The flake reference (either a folder or an url).
         :type flakeRef: str
         :param outputFile: The output file.
         :type outputFile: str
+        :param layout: The layout.
+        :type layout: str
         """
-        content = self.dot(flakeRef)
+        content = self.dot(flakeRef, layout)
         if content is not None:
             with open(outputFile, "w") as file:
                 file.write(content)
@@ -143,8 +170,12 @@ class Dot(EventListener):
     @listen(DotRequested)
     async def listen(cls, event: DotRequested):
         """
-        Receives a DotRequested event and generates a dot file.
+        Receives a DotRequested event and generates a dot file, or an HTML page.
+        The layout only applies to dot files.
         :param event: The event.
         :type event: rydnr.nix.flake.graphviz.events.DotRequested
         """
-        cls().generate_output(event.flake_ref, event.output_file)
+        if event.output_format == "html":
+            HtmlViewer().generate_output(event.flake_ref, event.output_file)
+        else:
+            cls().generate_output(event.flake_ref, event.output_file, event.layout)
@@ -0,0 +1,78 @@
+# vim: set fileencoding=utf-8
+"""
+rydnr/nix/flake/graphviz/events/diff_requested.py
+
+This file defines DiffRequested class.
+
+Copyright (C) 2023-today rydnr's nix-flake-to-graphviz
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.shared import Event
+
+
+class DiffRequested(Event):
+    """
+    A dot file representing the differences between two Nix flake dependency graphs is requested.
+
+    Class name: DiffRequested
+
+    Responsibilities:
+        - Represent the moment in which a diff has been requested.
+
+    Collaborators:
+        - None
+    """
+
+    def __init__(self, oldFlakeRef: str, newFlakeRef: str, outputFile: str):
+        """
+        Creates a new DiffRequested instance.
+        :param oldFlakeRef: The flake reference, or lock file, before the change.
+        :type oldFlakeRef: str
+        :param newFlakeRef: The flake reference, or lock file, after the change.
+        :type newFlakeRef: str
+        :param outputFile: The output file.
+        :type outputFile: str
+        """
+        super().__init__()
+        self._old_flake_ref = oldFlakeRef
+        self._new_flake_ref = newFlakeRef
+        self._output_file = outputFile
+
+    @property
+    def old_flake_ref(self) -> str:
+        """
+        Retrieves the flake reference before the change.
+        :return: The folder, url or lock file.
+        :rtype: str
+        """
+        return self._old_flake_ref
+
+    @property
+    def new_flake_ref(self) -> str:
+        """
+        Retrieves the flake reference after the change.
+        :return: The folder, url or lock file.
+        :rtype: str
+        """
+        return self._new_flake_ref
+
+    @property
+    def output_file(self) -> str:
+        """
+        Retrieves the output file.
+        :return: Such file.
+        :rtype: str
+        """
+        return self._output_file
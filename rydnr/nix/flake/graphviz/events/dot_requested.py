@@ -35,17 +35,29 @@ class DotRequested(Event):
         - None
     """
 
-    def __init__(self, flakeRef: str, outputFile: str):
+    def __init__(
+        self,
+        flakeRef: str,
+        outputFile: str,
+        layout: str = "dot",
+        outputFormat: str = "dot",
+    ):
         """
         Creates a new DotRequested instance.
         :param flakeRef: The flake reference (either a folder or an url).
         :type flakeRef: str
         :param outputFile: The output file.
         :type outputFile: str
+        :param layout: The layout ("dot" or "layered"), for dot output only.
+        :type layout: str
+        :param outputFormat: The output format ("dot" or "html").
+        :type outputFormat: str
         """
         super().__init__()
         self._flake_ref = flakeRef
         self._output_file = outputFile
+        self._layout = layout
+        self._output_format = outputFormat
 
     @property
     def flake_ref(self) -> str:
@@ -64,3 +76,21 @@ class DotRequested(Event):
         :rtype: str
         """
         return self._output_file
+
+    @property
+    def layout(self) -> str:
+        """
+        Retrieves the layout.
+        :return: "dot" to let Graphviz lay the graph out, or "layered" to pre-position the nodes.
+        :rtype: str
+        """
+        return self._layout
+
+    @property
+    def output_format(self) -> str:
+        """
+        Retrieves the output format.
+        :return: "dot" for a dot file, or "html" for an interactive page.
+        :rtype: str
+        """
+        return self._output_format
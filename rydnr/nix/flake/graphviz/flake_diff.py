@@ -0,0 +1,115 @@
+# vim: set fileencoding=utf-8
+"""
+rydnr/nix/flake/graphviz/flake_diff.py
+
+This file defines FlakeDiff class.
+
+Copyright (C) 2023-today rydnr's nix-flake-to-graphviz
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .flake_lock import FlakeLock
+from .flake_lock_diff import FlakeLockDiff
+from .template_path import template_path
+import json
+import os
+from pythoneda.shared import EventListener, listen
+from rydnr.nix.flake.graphviz.events import DiffRequested
+from stringtemplate3 import StringTemplateGroup
+
+
+class FlakeDiff(EventListener):
+    """
+    Creates a dot file, and a JSON summary, with the differences between two Nix flakes.
+
+    Class name: FlakeDiff
+
+    Responsibilities:
+        - Generate a dot file with only the changed nodes and their immediate context.
+        - Generate a JSON summary of the changes.
+
+    Collaborators:
+        - rydnr.nix.flake.graphviz.FlakeLock
+        - rydnr.nix.flake.graphviz.FlakeLockDiff
+    """
+
+    def __init__(self):
+        """
+        Creates a new FlakeDiff instance.
+        """
+        super().__init__()
+
+    def diff(self, oldFlakeRef: str, newFlakeRef: str) -> FlakeLockDiff:
+        """
+        Compares given flakes.
+        :param oldFlakeRef: The flake reference, or lock file, before the change.
+        :type oldFlakeRef: str
+        :param newFlakeRef: The flake reference, or lock file, after the change.
+        :type newFlakeRef: str
+        :return: The differences.
+        :rtype: rydnr.nix.flake.graphviz.FlakeLockDiff
+        """
+        return FlakeLockDiff(
+            FlakeLock.from_ref(oldFlakeRef), FlakeLock.from_ref(newFlakeRef)
+        )
+
+    def _convert_to_dot_format(self, diff: FlakeLockDiff) -> str:
+        """
+        Converts given differences to dot format.
+        :param diff: The differences.
+        :type diff: rydnr.nix.flake.graphviz.FlakeLockDiff
+        :return: A dot-formatted representation of the changed dependencies.
+        :rtype: str
+        """
+        with open(template_path("diff.stg"), "r", encoding="utf-8") as f:
+            group = StringTemplateGroup(name="diff", file=f, rootDir="templates")
+
+            root_template = group.getInstanceOf("graph")
+
+        if root_template is not None:
+            root_template["diff"] = diff
+
+        return str(root_template)
+
+    def generate_output(self, oldFlakeRef: str, newFlakeRef: str, outputFile: str):
+        """
+        Generates the output file, and the JSON summary next to it.
+        :param oldFlakeRef: The flake reference, or lock file, before the change.
+        :type oldFlakeRef: str
+        :param newFlakeRef: The flake reference, or lock file, after the change.
+        :type newFlakeRef: str
+        :param outputFile: The output file.
+        :type outputFile: str
+        """
+        diff = self.diff(oldFlakeRef, newFlakeRef)
+        with open(outputFile, "w") as file:
+            file.write(self._convert_to_dot_format(diff))
+        summary_file = f"{os.path.splitext(outputFile)[0]}.summary.json"
+        with open(summary_file, "w") as file:
+            json.dump(diff.summary, file, indent=2)
+        FlakeDiff.logger().info(
+            f"{outputFile} and {summary_file} files created successfully by {self.__class__}"
+        )
+
+    @classmethod
+    @listen(DiffRequested)
+    async def listen(cls, event: DiffRequested):
+        """
+        Receives a DiffRequested event and generates a dot file and a JSON summary.
+        :param event: The event.
+        :type event: rydnr.nix.flake.graphviz.events.DiffRequested
+        """
+        cls().generate_output(
+            event.old_flake_ref, event.new_flake_ref, event.output_file
+        )
@@ -0,0 +1,291 @@
+# vim: set fileencoding=utf-8
+"""
+rydnr/nix/flake/graphviz/flake_lock.py
+
+This file defines the FlakeLock class.
+
+Copyright (C) 2023-today rydnr's nix-flake-to-graphviz
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import json
+import os
+from pythoneda.shared import primary_key_attribute, ValueObject
+import subprocess
+from typing import Dict, List, Optional, Tuple
+
+
+class FlakeLock(ValueObject):
+    """
+    The locked dependency graph of a Nix flake, indexed by locked identity.
+
+    Class name: FlakeLock
+
+    Responsibilities:
+        - Load the lock of a flake, from a flake.lock file or a flake reference.
+        - Index its nodes by exact locked identity, and by project regardless of the version.
+        - Tolerate nodes with no locked identity, such as relative path: sub-flakes.
+
+    Collaborators:
+        - rydnr.nix.flake.graphviz.FlakeLockDiff
+    """
+
+    VOLATILE_KEYS = frozenset(
+        [
+            "rev",
+            "ref",
+            "narHash",
+            "lastModified",
+            "revCount",
+            "dirtyRev",
+            "dirtyShortRev",
+        ]
+    )
+
+    def __init__(self, ref: str, lock: Dict):
+        """
+        Creates a new FlakeLock instance.
+        :param ref: The flake reference, or the path of the lock file.
+        :type ref: str
+        :param lock: The parsed contents of the lock file.
+        :type lock: Dict
+        """
+        super().__init__()
+        self._ref = ref
+        self._lock = lock
+        self._nodes = lock.get("nodes", {})
+        self._root = lock.get("root", "root")
+        self._children = {}
+        self._parents = {}
+        self._identities = {}
+        self._projects = {}
+        self._by_identity = {}
+        self._by_project = {}
+        self._index()
+
+    @classmethod
+    def from_ref(cls, ref: str) -> "FlakeLock":
+        """
+        Loads the lock of given flake.
+        :param ref: A flake.lock file, a folder containing one, or any flake reference.
+        :type ref: str
+        :return: The FlakeLock instance.
+        :rtype: rydnr.nix.flake.graphviz.FlakeLock
+        """
+        path = ref
+        if os.path.isdir(path):
+            path = os.path.join(path, "flake.lock")
+        if os.path.isfile(path):
+            with open(path, "r", encoding="utf-8") as file:
+                return cls(ref, json.load(file))
+        output = subprocess.run(
+            ["nix", "flake", "metadata", "--json", ref],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        return cls(ref, json.loads(output).get("locks", {}))
+
+    @property
+    @primary_key_attribute
+    def ref(self) -> str:
+        """
+        Retrieves the flake reference.
+        :return: Such reference.
+        :rtype: str
+        """
+        return self._ref
+
+    @property
+    def root(self) -> str:
+        """
+        Retrieves the name of the root node.
+        :return: Such name.
+        :rtype: str
+        """
+        return self._root
+
+    @property
+    def by_identity(self) -> Dict[Tuple, List[str]]:
+        """
+        Retrieves the nodes indexed by exact locked identity.
+        :return: The node names of each locked identity.
+        :rtype: Dict[Tuple, List[str]]
+        """
+        return self._by_identity
+
+    @property
+    def by_project(self) -> Dict[Tuple, List[str]]:
+        """
+        Retrieves the nodes indexed by project, i.e. their original attributes without any version information.
+        :return: The node names of each project.
+        :rtype: Dict[Tuple, List[str]]
+        """
+        return self._by_project
+
+    def identity(self, name: str) -> Optional[Tuple]:
+        """
+        Retrieves the exact locked identity of given node.
+        :param name: The node name.
+        :type name: str
+        :return: Such identity, or None for the root and for nodes which are not locked.
+        :rtype: Optional[Tuple]
+        """
+        return self._identities.get(name)
+
+    def project(self, name: str) -> Optional[Tuple]:
+        """
+        Retrieves the project of given node.
+        :param name: The node name.
+        :type name: str
+        :return: Such project, or None for the root and for nodes which are not locked.
+        :rtype: Optional[Tuple]
+        """
+        return self._projects.get(name)
+
+    @classmethod
+    def project_of(cls, attributes: Dict) -> Tuple:
+        """
+        Retrieves the project described by given flake reference attributes.
+        Original attributes are preferred, since they stay the same across updates,
+        whereas locked ones, such as tarball urls, often embed the version.
+        :param attributes: The original, or locked, attributes.
+        :type attributes: Dict
+        :return: The attributes without their version-related entries.
+        :rtype: Tuple
+        """
+        return tuple(
+            sorted(
+                (key, value)
+                for key, value in attributes.items()
+                if key not in cls.VOLATILE_KEYS
+            )
+        )
+
+    @classmethod
+    def project_label(cls, project: Tuple) -> str:
+        """
+        Retrieves a human-readable description of given project.
+        :param project: The project.
+        :type project: Tuple
+        :return: Such description, e.g. github:NixOS/nixpkgs.
+        :rtype: str
+        """
+        entries = dict(project)
+        if "owner" in entries and "repo" in entries:
+            result = f"{entries.get('type')}:{entries['owner']}/{entries['repo']}"
+        elif "url" in entries:
+            result = f"{entries.get('type')}:{entries['url']}"
+        elif "path" in entries:
+            result = f"{entries.get('type')}:{entries['path']}"
+        elif "id" in entries:
+            result = f"{entries.get('type')}:{entries['id']}"
+        else:
+            result = ",".join(f"{key}={value}" for key, value in project)
+        if "dir" in entries:
+            result = f"{result}?dir={entries['dir']}"
+        return result
+
+    def name(self, node: str) -> str:
+        """
+        Retrieves the short name of given node.
+        :param node: The node name.
+        :type node: str
+        :return: The node name, without the numeric suffix Nix adds to tell duplicates apart.
+        :rtype: str
+        """
+        base, _, suffix = node.rpartition("_")
+        return base if base and suffix.isdigit() else node
+
+    def version(self, node: str) -> str:
+        """
+        Retrieves the version of given node.
+        :param node: The node name.
+        :type node: str
+        :return: The requested ref, if any, and the short locked revision.
+        :rtype: str
+        """
+        content = self._nodes[node]
+        ref = content.get("original", {}).get("ref")
+        locked = content.get("locked", {})
+        if "rev" in locked:
+            revision = locked["rev"][:7]
+        else:
+            revision = locked.get("narHash", "")[7:15]
+        if ref is None:
+            return revision
+        if not revision:
+            return ref
+        return f"{ref} ({revision})"
+
+    def children(self, name: str) -> List[str]:
+        """
+        Retrieves the inputs of given node.
+        :param name: The node name.
+        :type name: str
+        :return: The names of the nodes it depends on.
+        :rtype: List[str]
+        """
+        return self._children.get(name, [])
+
+    def parents(self, name: str) -> List[str]:
+        """
+        Retrieves the nodes depending on given node.
+        :param name: The node name.
+        :type name: str
+        :return: Such node names.
+        :rtype: List[str]
+        """
+        return self._parents.get(name, [])
+
+    def _resolve(self, target) -> str:
+        """
+        Resolves an input target, following "follows" paths from the root.
+        :param target: Either a node name, or a path of input names from the root.
+        :type target: str or List[str]
+        :return: The node name, or None if the path cannot be resolved.
+        :rtype: str
+        """
+        if isinstance(target, str):
+            return target
+        result = self._root
+        for step in target:
+            inputs = self._nodes.get(result, {}).get("inputs", {})
+            if step not in inputs:
+                return None
+            # nested follows resolve from the root as well
+            result = self._resolve(inputs[step])
+            if result is None:
+                return None
+        return result
+
+    def _index(self):
+        """
+        Builds the adjacency and identity indexes.
+        """
+        for name, content in self._nodes.items():
+            for target in content.get("inputs", {}).values():
+                child = self._resolve(target)
+                if child is None or child not in self._nodes:
+                    continue
+                self._children.setdefault(name, []).append(child)
+                self._parents.setdefault(child, []).append(name)
+            if name == self._root or "locked" not in content:
+                continue
+            identity = tuple(sorted(content["locked"].items()))
+            project = self.project_of(content.get("original") or content["locked"])
+            self._identities[name] = identity
+            self._projects[name] = project
+            self._by_identity.setdefault(identity, []).append(name)
+            self._by_project.setdefault(project, []).append(name)
@@ -0,0 +1,410 @@
+# vim: set fileencoding=utf-8
+"""
+rydnr/nix/flake/graphviz/flake_lock_diff.py
+
+This file defines the FlakeLockDiff class.
+
+Copyright (C) 2023-today rydnr's nix-flake-to-graphviz
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .diff_node import DiffNode
+from .flake_lock import FlakeLock
+from pythoneda.shared import primary_key_attribute, ValueObject
+from typing import Dict, List, Tuple
+
+
+class FlakeLockDiff(ValueObject):
+    """
+    The differences between two flake locks.
+
+    Class name: FlakeLockDiff
+
+    Responsibilities:
+        - Find added and removed inputs, version bumps, and new and resolved duplicates.
+        - Provide the changed nodes, and their immediate context, to templates.
+
+    Collaborators:
+        - rydnr.nix.flake.graphviz.FlakeLock
+        - rydnr.nix.flake.graphviz.DiffNode
+    """
+
+    SUMMARY_KEYS = {
+        "added": "added",
+        "removed": "removed",
+        "bumped": "bumped",
+        "new_duplicate": "new_duplicates",
+        "resolved_duplicate": "resolved_duplicates",
+    }
+
+    def __init__(self, old: FlakeLock, new: FlakeLock):
+        """
+        Creates a new FlakeLockDiff instance.
+        :param old: The lock before the change.
+        :type old: rydnr.nix.flake.graphviz.FlakeLock
+        :param new: The lock after the change.
+        :type new: rydnr.nix.flake.graphviz.FlakeLock
+        """
+        super().__init__()
+        self._old = old
+        self._new = new
+        self._summary = {key: [] for key in self.SUMMARY_KEYS.values()}
+        # node id -> change, for changed nodes
+        self._changes = {}
+        self._labels = {}
+        # used as an insertion-ordered set
+        self._edges = {}
+        self._compare()
+
+    @property
+    @primary_key_attribute
+    def old(self) -> FlakeLock:
+        """
+        Retrieves the lock before the change.
+        :return: Such lock.
+        :rtype: rydnr.nix.flake.graphviz.FlakeLock
+        """
+        return self._old
+
+    @property
+    @primary_key_attribute
+    def new(self) -> FlakeLock:
+        """
+        Retrieves the lock after the change.
+        :return: Such lock.
+        :rtype: rydnr.nix.flake.graphviz.FlakeLock
+        """
+        return self._new
+
+    @property
+    def title(self) -> str:
+        """
+        Retrieves the title.
+        :return: Such text.
+        :rtype: str
+        """
+        return f"{self.old.ref} -> {self.new.ref}"
+
+    @property
+    def summary(self) -> Dict:
+        """
+        Retrieves the summary of the changes.
+        :return: The affected inputs, for each kind of change.
+        :rtype: Dict
+        """
+        result = {"old": self.old.ref, "new": self.new.ref}
+        for key, entries in self._summary.items():
+            result[key] = sorted(entries, key=lambda entry: entry["input"])
+        return result
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Checks whether both locks are equivalent.
+        :return: True in such case.
+        :rtype: bool
+        """
+        return not self._changes
+
+    def _nodes(self, change: str) -> List[DiffNode]:
+        """
+        Retrieves the nodes affected by given change.
+        :param change: The change.
+        :type change: str
+        :return: Such nodes.
+        :rtype: List[rydnr.nix.flake.graphviz.DiffNode]
+        """
+        return [
+            DiffNode(id, self._labels[id])
+            for id, node_change in self._changes.items()
+            if node_change == change
+        ]
+
+    @property
+    def added_nodes(self) -> List[DiffNode]:
+        """
+        Retrieves the nodes of inputs not present before.
+        :return: Such nodes.
+        :rtype: List[rydnr.nix.flake.graphviz.DiffNode]
+        """
+        return self._nodes("added")
+
+    @property
+    def removed_nodes(self) -> List[DiffNode]:
+        """
+        Retrieves the nodes of inputs no longer present.
+        :return: Such nodes.
+        :rtype: List[rydnr.nix.flake.graphviz.DiffNode]
+        """
+        return self._nodes("removed")
+
+    @property
+    def bumped_nodes(self) -> List[DiffNode]:
+        """
+        Retrieves the nodes of inputs locked to a different version.
+        :return: Such nodes.
+        :rtype: List[rydnr.nix.flake.graphviz.DiffNode]
+        """
+        return self._nodes("bumped")
+
+    @property
+    def new_duplicate_nodes(self) -> List[DiffNode]:
+        """
+        Retrieves the nodes of inputs which became duplicated.
+        :return: Such nodes.
+        :rtype: List[rydnr.nix.flake.graphviz.DiffNode]
+        """
+        return self._nodes("new_duplicate")
+
+    @property
+    def resolved_duplicate_nodes(self) -> List[DiffNode]:
+        """
+        Retrieves the nodes of inputs which are no longer duplicated.
+        :return: Such nodes.
+        :rtype: List[rydnr.nix.flake.graphviz.DiffNode]
+        """
+        return self._nodes("resolved_duplicate")
+
+    @property
+    def context_nodes(self) -> List[DiffNode]:
+        """
+        Retrieves the unchanged nodes linked to any changed node.
+        :return: Such nodes.
+        :rtype: List[rydnr.nix.flake.graphviz.DiffNode]
+        """
+        return [
+            DiffNode(id, label)
+            for id, label in self._labels.items()
+            if id not in self._changes
+        ]
+
+    @property
+    def edges(self) -> List[Dict[str, str]]:
+        """
+        Retrieves the edges between changed nodes and their context.
+        :return: The source and destination identifiers of each edge.
+        :rtype: List[Dict[str, str]]
+        """
+        return [
+            {"source": source, "destination": destination}
+            for source, destination in self._edges
+        ]
+
+    def _changed_projects(self) -> List[Tuple]:
+        """
+        Retrieves the projects with any locked identity whose number of nodes differs between both locks.
+        :return: Such projects, sorted so the output does not depend on hashing.
+        :rtype: List[Tuple]
+        """
+        old = self.old.by_identity
+        new = self.new.by_identity
+        identities = old.keys() ^ new.keys()
+        identities.update(
+            identity
+            for identity in old.keys() & new.keys()
+            if len(old[identity]) != len(new[identity])
+        )
+        result = set()
+        for identity in identities:
+            result.update(self.old.project(node) for node in old.get(identity, []))
+            result.update(self.new.project(node) for node in new.get(identity, []))
+        return sorted(result, key=repr)
+
+    def _compare(self):
+        """
+        Compares both locks, visiting only the projects whose locked identities changed.
+        """
+        for project in self._changed_projects():
+            old_nodes = self.old.by_project.get(project, [])
+            new_nodes = self.new.by_project.get(project, [])
+            label = FlakeLock.project_label(project)
+            old_versions = sorted({self.old.version(node) for node in old_nodes})
+            new_versions = sorted({self.new.version(node) for node in new_nodes})
+            if not old_nodes:
+                self._summary["added"].append(
+                    {"input": label, "versions": new_versions}
+                )
+                for node in new_nodes:
+                    self._mark(self.new, "new", node, "added")
+                continue
+            if not new_nodes:
+                self._summary["removed"].append(
+                    {"input": label, "versions": old_versions}
+                )
+                for node in old_nodes:
+                    self._mark(self.old, "old", node, "removed")
+                continue
+            appeared, disappeared = self._unmatched(old_nodes, new_nodes)
+            bumps = self._pair(appeared, disappeared)
+            if bumps:
+                self._summary["bumped"].append(
+                    {
+                        "input": label,
+                        "from": sorted({self.old.version(old) for old, _ in bumps}),
+                        "to": sorted({self.new.version(new) for _, new in bumps}),
+                    }
+                )
+                for old, new in bumps:
+                    self._mark(
+                        self.new,
+                        "new",
+                        new,
+                        "bumped",
+                        f"{self.old.version(old)} -> {self.new.version(new)}",
+                    )
+            # whatever is left was added to, or dropped from, the project
+            if appeared:
+                self._summary["new_duplicates"].append(
+                    {"input": label, "from": old_versions, "to": new_versions}
+                )
+                for node in appeared:
+                    self._mark(self.new, "new", node, "new_duplicate")
+            if disappeared:
+                self._summary["resolved_duplicates"].append(
+                    {"input": label, "from": old_versions, "to": new_versions}
+                )
+                for node in disappeared:
+                    self._mark(self.old, "old", node, "resolved_duplicate")
+
+    def _unmatched(
+        self, oldNodes: List[str], newNodes: List[str]
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Finds the nodes of a project whose locked identity has no counterpart on the other side.
+        Nodes sharing the same identity are matched by name first, and then in order.
+        :param oldNodes: The nodes of the project in the old lock.
+        :type oldNodes: List[str]
+        :param newNodes: The nodes of the project in the new lock.
+        :type newNodes: List[str]
+        :return: The nodes that appeared in the new lock, and the ones that disappeared from the old one.
+        :rtype: Tuple[List[str], List[str]]
+        """
+        old_by_identity = {}
+        for node in oldNodes:
+            old_by_identity.setdefault(self.old.identity(node), []).append(node)
+        new_by_identity = {}
+        for node in newNodes:
+            new_by_identity.setdefault(self.new.identity(node), []).append(node)
+        appeared = []
+        disappeared = []
+        for identity in old_by_identity.keys() | new_by_identity.keys():
+            old = old_by_identity.get(identity, [])
+            new = new_by_identity.get(identity, [])
+            common = set(old) & set(new)
+            old = sorted(node for node in old if node not in common)
+            new = sorted(node for node in new if node not in common)
+            matched = min(len(old), len(new))
+            disappeared.extend(old[matched:])
+            appeared.extend(new[matched:])
+        return sorted(appeared), sorted(disappeared)
+
+    def _pair(
+        self, appeared: List[str], disappeared: List[str]
+    ) -> List[Tuple[str, str]]:
+        """
+        Pairs nodes whose locked identity was replaced, preferring nodes with the same name.
+        Paired nodes are removed from both lists; the rest were added to or dropped from the project.
+        :param appeared: The nodes that appeared in the new lock, updated in place.
+        :type appeared: List[str]
+        :param disappeared: The nodes that disappeared from the old lock, updated in place.
+        :type disappeared: List[str]
+        :return: The (old, new) node pairs.
+        :rtype: List[Tuple[str, str]]
+        """
+        result = [(node, node) for node in appeared if node in disappeared]
+        for node, _ in result:
+            appeared.remove(node)
+            disappeared.remove(node)
+        while appeared and disappeared:
+            result.append((disappeared.pop(0), appeared.pop(0)))
+        return result
+
+    def _id(self, lock: FlakeLock, side: str, node: str) -> str:
+        """
+        Retrieves the identifier of given node in the diff graph.
+        Nodes of the old lock still present in the new one, either with the same locked
+        identity or as the only node of the same project, are merged into the latter.
+        :param lock: The lock the node belongs to.
+        :type lock: rydnr.nix.flake.graphviz.FlakeLock
+        :param side: Either "old" or "new".
+        :type side: str
+        :param node: The node name.
+        :type node: str
+        :return: Such identifier.
+        :rtype: str
+        """
+        if node == lock.root:
+            return "root"
+        if side == "old":
+            identity = lock.identity(node)
+            if identity is None:
+                return f"{side}:{node}"
+            same = self.new.by_identity.get(identity)
+            if not same:
+                same = self.new.by_project.get(lock.project(node), [])
+                if len(same) != 1:
+                    same = None
+            if same:
+                return f"new:{same[0]}"
+        return f"{side}:{node}"
+
+    def _label(self, lock: FlakeLock, node: str, version: str = None) -> str:
+        """
+        Builds the label of given node.
+        :param lock: The lock the node belongs to.
+        :type lock: rydnr.nix.flake.graphviz.FlakeLock
+        :param node: The node name.
+        :type node: str
+        :param version: The version to display, if not the locked one.
+        :type version: str
+        :return: Such label.
+        :rtype: str
+        """
+        if node == lock.root:
+            return "inputs"
+        if version is None:
+            version = lock.version(node)
+        return f"{lock.name(node)}\\n{version}"
+
+    def _mark(
+        self, lock: FlakeLock, side: str, node: str, change: str, version: str = None
+    ):
+        """
+        Marks given node as changed, and adds its immediate context.
+        A node keeps the first change it gets marked with.
+        :param lock: The lock the node belongs to.
+        :type lock: rydnr.nix.flake.graphviz.FlakeLock
+        :param side: Either "old" or "new".
+        :type side: str
+        :param node: The node name.
+        :type node: str
+        :param change: The change.
+        :type change: str
+        :param version: The version to display, if not the locked one.
+        :type version: str
+        """
+        # the changed node itself is never merged into another one
+        id = "root" if node == lock.root else f"{side}:{node}"
+        if id in self._changes:
+            return
+        self._changes[id] = change
+        self._labels[id] = self._label(lock, node, version)
+        for parent in lock.parents(node):
+            parent_id = self._id(lock, side, parent)
+            self._labels.setdefault(parent_id, self._label(lock, parent))
+            self._edges[(parent_id, id)] = None
+        for child in lock.children(node):
+            child_id = self._id(lock, side, child)
+            self._labels.setdefault(child_id, self._label(lock, child))
+            self._edges[(id, child_id)] = None
@@ -0,0 +1,185 @@
+# vim: set fileencoding=utf-8
+"""
+rydnr/nix/flake/graphviz/html_viewer.py
+
+This file defines HtmlViewer class.
+
+Copyright (C) 2023-today rydnr's nix-flake-to-graphviz
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from .nix_flake_metadata_decorator import NixFlakeMetadataDecorator
+from .template_path import template_path
+import html
+import json
+import os
+from pythoneda.shared import EventListener
+from pythoneda.shared.nix.flake import NixFlakeInput, NixFlakeMetadata
+from typing import Dict, List
+
+
+class HtmlViewer(EventListener):
+    """
+    Creates an interactive HTML page to browse the dependencies of a given Nix flake.
+
+    Class name: HtmlViewer
+
+    Responsibilities:
+        - Generate a page embedding only the root and the direct inputs.
+        - Precompute the inputs of every other node as separate chunks, loaded on demand.
+
+    Collaborators:
+        - rydnr.nix.flake.graphviz.NixFlakeMetadataDecorator
+    """
+
+    def __init__(self):
+        """
+        Creates a new HtmlViewer instance.
+        """
+        super().__init__()
+
+    def _chunk_folder(self, outputFile: str) -> str:
+        """
+        Retrieves the folder where the chunks are stored, next to the output file.
+        :param outputFile: The output file.
+        :type outputFile: str
+        :return: Such folder.
+        :rtype: str
+        """
+        return f"{os.path.splitext(outputFile)[0]}_chunks"
+
+    def _prepare_chunk_folder(self, folder: str):
+        """
+        Creates the chunk folder, or removes the chunks of a previous run from it,
+        since their numbers would point to different nodes.
+        :param folder: The chunk folder.
+        :type folder: str
+        """
+        os.makedirs(folder, exist_ok=True)
+        for entry in os.listdir(folder):
+            name, extension = os.path.splitext(entry)
+            path = os.path.join(folder, entry)
+            if extension == ".js" and name.isdigit() and os.path.isfile(path):
+                os.remove(path)
+
+    def _classify(self, flake: NixFlakeMetadataDecorator) -> Dict[str, str]:
+        """
+        Maps each input to its CSS class, mirroring the colour scheme in dot.stg.
+        :param flake: The decorated Nix flake metadata.
+        :type flake: rydnr.nix.flake.graphviz.NixFlakeMetadataDecorator
+        :return: The class of each input, by name.
+        :rtype: Dict[str, str]
+        """
+        result = {}
+        for css_class, deps in [
+            ("direct-no-duplicates", flake.inputs_with_no_duplicates),
+            (
+                "direct-duplicates-same-version",
+                flake.inputs_with_duplicates_with_same_version,
+            ),
+            (
+                "direct-duplicates-different-versions",
+                flake.inputs_with_duplicates_with_different_versions,
+            ),
+            ("indirect-no-duplicates", flake.indirect_inputs_with_no_duplicates),
+            (
+                "indirect-duplicates-same-version",
+                flake.indirect_inputs_with_duplicates_with_same_version,
+            ),
+            (
+                "indirect-duplicates-different-versions",
+                flake.indirect_inputs_with_duplicates_with_different_versions,
+            ),
+        ]:
+            for dep in deps:
+                result[dep.name_in_camelcase] = css_class
+        return result
+
+    def _entry(
+        self,
+        dep: NixFlakeInput,
+        classes: Dict[str, str],
+        chunks: Dict[str, int],
+    ) -> Dict:
+        """
+        Builds the entry describing given input.
+        :param dep: The input.
+        :type dep: pythoneda.shared.nix.flake.NixFlakeInput
+        :param classes: The class of each input.
+        :type classes: Dict[str, str]
+        :param chunks: The chunk of each input with inputs of its own.
+        :type chunks: Dict[str, int]
+        :return: The entry.
+        :rtype: Dict
+        """
+        return {
+            "label": dep.normalized_name,
+            "version": dep.version,
+            "class": classes.get(dep.name_in_camelcase, "indirect-no-duplicates"),
+            "chunk": chunks.get(dep.name_in_camelcase),
+        }
+
+    def _to_script(self, content) -> str:
+        """
+        Serializes given content as JSON that can be safely embedded in a script.
+        :param content: The content.
+        :type content: Any
+        :return: The JSON text.
+        :rtype: str
+        """
+        return json.dumps(content, separators=(",", ":")).replace("</", "<\\/")
+
+    def generate_output(self, flakeRef: str, outputFile: str):
+        """
+        Generates the HTML page, and its chunks.
+        :param flakeRef: The flake reference (either a folder or an url).
+        :type flakeRef: str
+        :param outputFile: The output file.
+        :type outputFile: str
+        """
+        flake = NixFlakeMetadataDecorator(NixFlakeMetadata.from_ref(flakeRef))
+        classes = self._classify(flake)
+
+        children: Dict[str, List[NixFlakeInput]] = {}
+        for edge in flake.all_edges:
+            children.setdefault(edge.source.name_in_camelcase, []).append(
+                edge.destination
+            )
+        chunks = {name: index for index, name in enumerate(children)}
+
+        chunk_folder = self._chunk_folder(outputFile)
+        self._prepare_chunk_folder(chunk_folder)
+        for name, deps in children.items():
+            entries = [self._entry(dep, classes, chunks) for dep in deps]
+            with open(
+                os.path.join(chunk_folder, f"{chunks[name]}.js"), "w", encoding="utf-8"
+            ) as file:
+                file.write(
+                    f"nixFlakeGraph.loaded({chunks[name]},{self._to_script(entries)});\n"
+                )
+
+        index = {
+            "chunks": os.path.basename(chunk_folder),
+            "inputs": [self._entry(dep, classes, chunks) for dep in flake.inputs],
+        }
+        with open(template_path("viewer.html.template"), "r", encoding="utf-8") as file:
+            content = file.read()
+        content = content.replace("@title@", html.escape(flake.title)).replace(
+            "@index@", self._to_script(index)
+        )
+        with open(outputFile, "w", encoding="utf-8") as file:
+            file.write(content)
+        HtmlViewer.logger().info(
+            f"{outputFile} file created successfully by {self.__class__}, with {len(chunks)} chunks in {chunk_folder}"
+        )
@@ -20,20 +20,22 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 from argparse import ArgumentParser
+import sys
 from pythoneda.shared import PrimaryPort
 from pythoneda.shared.application import PythonEDA
 from pythoneda.shared.infrastructure.cli import CliHandler
-from rydnr.nix.flake.graphviz.events import DotRequested
+from rydnr.nix.flake.graphviz.events import DiffRequested, DotRequested
 
 
 class DotRequestedCli(CliHandler, PrimaryPort):
     """
-    A PrimaryPort used to inject a DotRequested into nix-flake-to-graphviz application.
+    A PrimaryPort used to inject a DotRequested, or a DiffRequested, into nix-flake-to-graphviz application.
 
     Class name: FlakeFolderCli
 
     Responsibilities:
         - Parse the command-line to retrieve the information to build a DotRequested event.
+        - Build a DiffRequested event instead, if another flake to compare with is provided.
 
     Collaborators:
         - pythoneda.shared.application.PythonEDA: It is notified back with the information retrieved from the command line.
@@ -84,6 +86,26 @@ class DotRequestedCli(CliHandler, PrimaryPort):
         parser.add_argument(
             "-o", "--output-file", required=True, help="The output file"
         )
+        parser.add_argument(
+            "-l",
+            "--layout",
+            choices=["dot", "layered"],
+            default="dot",
+            help="The layout of dot output: dot (default) leaves it to Graphviz, layered pre-positions the nodes for neato -n",
+        )
+        parser.add_argument(
+            "-t",
+            "--format",
+            choices=["dot", "html"],
+            default="dot",
+            help="The output format: dot (default), or html for an interactive page loading deeper levels on demand",
+        )
+        parser.add_argument(
+            "-d",
+            "--diff-against",
+            required=False,
+            help="The flake reference, or lock file, to compare with. The output shows only what changed from it to --flake-ref, and a JSON summary is written next to it, as <output-file-name>.summary.json",
+        )
 
     async def handle(self, app: PythonEDA, args):
         """
@@ -93,4 +115,24 @@ class DotRequestedCli(CliHandler, PrimaryPort):
         :param args: The CLI args.
         :type args: argparse.args
         """
-        await app.accept(DotRequested(args.flake_ref, args.output_file))
+        if args.layout != "dot" and args.format != "dot":
+            self._reject("--layout only applies to --format dot")
+        if args.diff_against and (args.layout != "dot" or args.format != "dot"):
+            self._reject("--diff-against only supports --format dot and --layout dot")
+        if args.diff_against:
+            await app.accept(
+                DiffRequested(args.diff_against, args.flake_ref, args.output_file)
+            )
+        else:
+            await app.accept(
+                DotRequested(args.flake_ref, args.output_file, args.layout, args.format)
+            )
+
+    def _reject(self, message: str):
+        """
+        Aborts on an invalid combination of arguments, the same way argparse does.
+        :param message: The error message.
+        :type message: str
+        """
+        print(f"{sys.argv[0]}: error: {message}", file=sys.stderr)
+        sys.exit(2)
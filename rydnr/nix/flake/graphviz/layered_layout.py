@@ -0,0 +1,323 @@
+# vim: set fileencoding=utf-8
+"""
+rydnr/nix/flake/graphviz/layered_layout.py
+
+This file defines the LayeredLayout class.
+
+Copyright (C) 2023-today rydnr's nix-flake-to-graphviz
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from collections import deque
+from typing import Dict, List, Tuple
+
+
+class LayeredLayout:
+    """
+    Computes a Sugiyama-style layered layout of a graph rooted at a given node.
+
+    Class name: LayeredLayout
+
+    Responsibilities:
+        - Assign each node a rank (its longest-path depth from the root).
+        - Reduce edge crossings with barycenter sweeps.
+        - Assign left-to-right coordinates, in points, to every node.
+
+    Collaborators:
+        - rydnr.nix.flake.graphviz.Dot
+    """
+
+    def __init__(
+        self,
+        root: str,
+        edges: List[Tuple[str, str]],
+        rankSeparation: float = 300.0,
+        nodeSeparation: float = 72.0,
+        sweeps: int = 4,
+    ):
+        """
+        Creates a new LayeredLayout instance.
+        :param root: The root node.
+        :type root: str
+        :param edges: The edges, as (source, destination) tuples.
+        :type edges: List[Tuple[str, str]]
+        :param rankSeparation: The horizontal distance between ranks, in points.
+        :type rankSeparation: float
+        :param nodeSeparation: The vertical distance between nodes, in points.
+        :type nodeSeparation: float
+        :param sweeps: The number of down-and-up crossing reduction sweeps.
+        :type sweeps: int
+        """
+        super().__init__()
+        self._root = root
+        self._edges = edges
+        self._rank_separation = rankSeparation
+        self._node_separation = nodeSeparation
+        self._sweeps = sweeps
+
+    @property
+    def root(self) -> str:
+        """
+        Retrieves the root node.
+        :return: Such node.
+        :rtype: str
+        """
+        return self._root
+
+    @property
+    def edges(self) -> List[Tuple[str, str]]:
+        """
+        Retrieves the edges.
+        :return: Such edges.
+        :rtype: List[Tuple[str, str]]
+        """
+        return self._edges
+
+    @property
+    def rank_separation(self) -> float:
+        """
+        Retrieves the horizontal distance between ranks.
+        :return: Such distance, in points.
+        :rtype: float
+        """
+        return self._rank_separation
+
+    @property
+    def node_separation(self) -> float:
+        """
+        Retrieves the vertical distance between nodes of the same rank.
+        :return: Such distance, in points.
+        :rtype: float
+        """
+        return self._node_separation
+
+    @property
+    def sweeps(self) -> int:
+        """
+        Retrieves the number of crossing reduction sweeps.
+        :return: Such number.
+        :rtype: int
+        """
+        return self._sweeps
+
+    def positions(self) -> Dict[str, Tuple[float, float]]:
+        """
+        Computes the position of every node.
+        :return: A map of node to its (x, y) coordinates, in points.
+        :rtype: Dict[str, Tuple[float, float]]
+        """
+        successors, predecessors = self._adjacency()
+        ranks = self._assign_ranks(successors, predecessors)
+        layers = self._initial_order(ranks, successors)
+        self._reduce_crossings(layers, successors, predecessors)
+        return self._assign_coordinates(layers, predecessors)
+
+    def _adjacency(self) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """
+        Builds the successor and predecessor lists, ignoring self-loops and duplicated edges.
+        :return: The successors and predecessors of each node.
+        :rtype: Tuple[Dict[str, List[str]], Dict[str, List[str]]]
+        """
+        successors = {self.root: []}
+        predecessors = {self.root: []}
+        seen = set()
+        for source, destination in self.edges:
+            if source == destination or (source, destination) in seen:
+                continue
+            seen.add((source, destination))
+            successors.setdefault(source, []).append(destination)
+            successors.setdefault(destination, [])
+            predecessors.setdefault(destination, []).append(source)
+            predecessors.setdefault(source, [])
+        return successors, predecessors
+
+    def _assign_ranks(
+        self, successors: Dict[str, List[str]], predecessors: Dict[str, List[str]]
+    ) -> Dict[str, int]:
+        """
+        Ranks each node by its longest-path depth from the root, so every edge points rightwards.
+        Nodes in cycles, or unreachable from the root, are ranked right after their ranked predecessors.
+        :param successors: The successors of each node.
+        :type successors: Dict[str, List[str]]
+        :param predecessors: The predecessors of each node.
+        :type predecessors: Dict[str, List[str]]
+        :return: The rank of each node.
+        :rtype: Dict[str, int]
+        """
+        pending = {node: len(preds) for node, preds in predecessors.items()}
+        ranks = {}
+        queue = deque(node for node, count in pending.items() if count == 0)
+        if self.root in pending and pending[self.root] == 0:
+            queue.remove(self.root)
+            queue.appendleft(self.root)
+        while True:
+            while queue:
+                node = queue.popleft()
+                rank = ranks.setdefault(node, 0)
+                for successor in successors[node]:
+                    if pending[successor] <= 0:
+                        # already released while breaking a cycle
+                        continue
+                    if ranks.get(successor, -1) <= rank:
+                        ranks[successor] = rank + 1
+                    pending[successor] -= 1
+                    if pending[successor] == 0:
+                        queue.append(successor)
+            # break cycles by releasing one node still waiting for predecessors
+            blocked = [
+                node for node, count in pending.items() if count > 0 and node in ranks
+            ]
+            if not blocked:
+                blocked = [node for node, count in pending.items() if count > 0]
+            if not blocked:
+                break
+            node = min(blocked, key=lambda n: ranks.get(n, 0))
+            pending[node] = 0
+            queue.append(node)
+        return ranks
+
+    def _initial_order(
+        self, ranks: Dict[str, int], successors: Dict[str, List[str]]
+    ) -> List[List[str]]:
+        """
+        Groups the nodes in layers, ordered by breadth-first discovery from the root.
+        :param ranks: The rank of each node.
+        :type ranks: Dict[str, int]
+        :param successors: The successors of each node.
+        :type successors: Dict[str, List[str]]
+        :return: The ordered layers.
+        :rtype: List[List[str]]
+        """
+        layers = [[] for _ in range(max(ranks.values(), default=0) + 1)]
+        visited = set()
+        queue = deque([self.root])
+        visited.add(self.root)
+        while queue:
+            node = queue.popleft()
+            layers[ranks[node]].append(node)
+            for successor in successors[node]:
+                if successor not in visited:
+                    visited.add(successor)
+                    queue.append(successor)
+        for node in successors:
+            if node not in visited:
+                layers[ranks[node]].append(node)
+        return layers
+
+    def _reduce_crossings(
+        self,
+        layers: List[List[str]],
+        successors: Dict[str, List[str]],
+        predecessors: Dict[str, List[str]],
+    ):
+        """
+        Reorders each layer by the barycenter of its neighbours, sweeping rightwards and then leftwards.
+        Edges spanning several ranks are weighted by the relative position of their endpoints, instead
+        of introducing dummy nodes.
+        :param layers: The layers, reordered in place.
+        :type layers: List[List[str]]
+        :param successors: The successors of each node.
+        :type successors: Dict[str, List[str]]
+        :param predecessors: The predecessors of each node.
+        :type predecessors: Dict[str, List[str]]
+        """
+        relative = {}
+        for layer in layers:
+            self._update_relative_positions(layer, relative)
+        for _ in range(self.sweeps):
+            for layer in layers[1:]:
+                self._sort_by_barycenter(layer, predecessors, relative)
+            for layer in reversed(layers[:-1]):
+                self._sort_by_barycenter(layer, successors, relative)
+
+    def _sort_by_barycenter(
+        self,
+        layer: List[str],
+        neighbours: Dict[str, List[str]],
+        relative: Dict[str, float],
+    ):
+        """
+        Sorts given layer by the average relative position of each node's neighbours.
+        Nodes with no neighbours keep their current relative position.
+        :param layer: The layer, sorted in place.
+        :type layer: List[str]
+        :param neighbours: The neighbours to compute the barycenter from.
+        :type neighbours: Dict[str, List[str]]
+        :param relative: The relative position of each node, updated in place.
+        :type relative: Dict[str, float]
+        """
+        barycenters = {}
+        for node in layer:
+            adjacent = neighbours[node]
+            if adjacent:
+                barycenters[node] = sum(relative[n] for n in adjacent) / len(adjacent)
+            else:
+                barycenters[node] = relative[node]
+        layer.sort(key=barycenters.__getitem__)
+        self._update_relative_positions(layer, relative)
+
+    def _update_relative_positions(self, layer: List[str], relative: Dict[str, float]):
+        """
+        Stores the position of each node in given layer, normalized to [0, 1].
+        :param layer: The layer.
+        :type layer: List[str]
+        :param relative: The relative position of each node, updated in place.
+        :type relative: Dict[str, float]
+        """
+        size = len(layer)
+        for index, node in enumerate(layer):
+            relative[node] = (index + 0.5) / size
+
+    def _assign_coordinates(
+        self, layers: List[List[str]], predecessors: Dict[str, List[str]]
+    ) -> Dict[str, Tuple[float, float]]:
+        """
+        Assigns the coordinates of each node. Each node is placed as close as possible to the
+        average height of its predecessors, keeping the layer order and the node separation.
+        :param layers: The ordered layers.
+        :type layers: List[List[str]]
+        :param predecessors: The predecessors of each node.
+        :type predecessors: Dict[str, List[str]]
+        :return: A map of node to its (x, y) coordinates, in points.
+        :rtype: Dict[str, Tuple[float, float]]
+        """
+        heights = {}
+        for layer in layers:
+            desired = []
+            for index, node in enumerate(layer):
+                placed = [heights[n] for n in predecessors[node] if n in heights]
+                if placed:
+                    desired.append(sum(placed) / len(placed))
+                else:
+                    desired.append(index * self.node_separation)
+            actual = list(desired)
+            for index in range(1, len(actual)):
+                actual[index] = max(
+                    actual[index], actual[index - 1] + self.node_separation
+                )
+            if actual:
+                # recenter the layer, since pushing down only ever moves nodes one way
+                shift = (sum(desired) - sum(actual)) / len(actual)
+                for index, node in enumerate(layer):
+                    heights[node] = actual[index] + shift
+
+        bottom = min(heights.values(), default=0.0)
+        result = {}
+        for rank, layer in enumerate(layers):
+            for node in layer:
+                result[node] = (
+                    round(rank * self.rank_separation, 2),
+                    round(heights[node] - bottom, 2),
+                )
+        return result
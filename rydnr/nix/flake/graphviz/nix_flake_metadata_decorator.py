@@ -19,13 +19,14 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+from .node_position import NodePosition
 from pythoneda.shared import primary_key_attribute, ValueObject
 from pythoneda.shared.nix.flake import (
     NixFlakeInput,
     NixFlakeInputRelationship,
     NixFlakeMetadata,
 )
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 
 class NixFlakeMetadataDecorator(ValueObject):
@@ -41,12 +42,21 @@ class NixFlakeMetadataDecorator(ValueObject):
         - rydnr.nix.flake.graphviz.Dot
     """
 
-    def __init__(self, metadata: NixFlakeMetadata):
+    def __init__(
+        self,
+        metadata: NixFlakeMetadata,
+        positions: Optional[Dict[str, Tuple[float, float]]] = None,
+    ):
         """
         Creates a new NixFlakeMetadataDecorator instance.
+        :param metadata: The Nix flake metadata.
+        :type metadata: pythoneda.shared.nix.flake.NixFlakeMetadata
+        :param positions: The precomputed node positions, if any.
+        :type positions: Optional[Dict[str, Tuple[float, float]]]
         """
         super().__init__()
         self._metadata = metadata
+        self._positions = positions
 
     @property
     @primary_key_attribute
@@ -58,6 +68,15 @@ class NixFlakeMetadataDecorator(ValueObject):
         """
         return self._metadata
 
+    @property
+    def positions(self) -> Optional[Dict[str, Tuple[float, float]]]:
+        """
+        Retrieves the precomputed node positions.
+        :return: A map of node name to its (x, y) coordinates, or None.
+        :rtype: Optional[Dict[str, Tuple[float, float]]]
+        """
+        return self._positions
+
     @property
     def title(self) -> str:
         """
@@ -150,3 +169,14 @@ class NixFlakeMetadataDecorator(ValueObject):
         :rtype: List[pythoneda.shared.nix.flake.NixFlakeInputRelationship]
         """
         return self.metadata.relationships_for_duplicated_nodes()
+
+    @property
+    def node_positions(self) -> List[NodePosition]:
+        """
+        Retrieves the precomputed position of each node.
+        :return: Such positions, or an empty list if no layout was computed.
+        :rtype: List[rydnr.nix.flake.graphviz.NodePosition]
+        """
+        if self.positions is None:
+            return []
+        return [NodePosition(name, x, y) for name, (x, y) in self.positions.items()]
@@ -0,0 +1,89 @@
+# vim: set fileencoding=utf-8
+"""
+rydnr/nix/flake/graphviz/node_position.py
+
+This file defines the NodePosition class.
+
+Copyright (C) 2023-today rydnr's nix-flake-to-graphviz
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from pythoneda.shared import primary_key_attribute, ValueObject
+
+
+class NodePosition(ValueObject):
+    """
+    The precomputed position of a node in the graph.
+
+    Class name: NodePosition
+
+    Responsibilities:
+        - Provide the position of a node to templates.
+
+    Collaborators:
+        - rydnr.nix.flake.graphviz.LayeredLayout
+        - rydnr.nix.flake.graphviz.NixFlakeMetadataDecorator
+    """
+
+    def __init__(self, name: str, x: float, y: float):
+        """
+        Creates a new NodePosition instance.
+        :param name: The node name.
+        :type name: str
+        :param x: The horizontal coordinate, in points.
+        :type x: float
+        :param y: The vertical coordinate, in points.
+        :type y: float
+        """
+        super().__init__()
+        self._name = name
+        self._x = x
+        self._y = y
+
+    @property
+    @primary_key_attribute
+    def name(self) -> str:
+        """
+        Retrieves the node name.
+        :return: Such name.
+        :rtype: str
+        """
+        return self._name
+
+    @property
+    def x(self) -> float:
+        """
+        Retrieves the horizontal coordinate.
+        :return: Such coordinate, in points.
+        :rtype: float
+        """
+        return self._x
+
+    @property
+    def y(self) -> float:
+        """
+        Retrieves the vertical coordinate.
+        :return: Such coordinate, in points.
+        :rtype: float
+        """
+        return self._y
+
+    @property
+    def pos(self) -> str:
+        """
+        Retrieves the position in Graphviz's pos format.
+        :return: Such position.
+        :rtype: str
+        """
+        return f"{self.x:g},{self.y:g}"
@@ -0,0 +1,39 @@
+# vim: set fileencoding=utf-8
+"""
+rydnr/nix/flake/graphviz/template_path.py
+
+This file defines the template_path function.
+
+Copyright (C) 2023-today rydnr's nix-flake-to-graphviz
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import os
+
+
+def template_path(fileName: str) -> str:
+    """
+    Retrieves the path of the template matching given name.
+    :param fileName: The name of the file of the template.
+    :type fileName: str
+    :return: The path of the template.
+    :rtype: str
+    """
+    return os.path.join(
+        os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+        ),
+        "templates",
+        fileName,
+    )